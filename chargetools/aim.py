@@ -1,9 +1,56 @@
+import mmap
 import re
-from copy import copy
 
 import numpy as np
 
-from chargetools.utils.utils import consume_lines, genfromstring
+from chargetools.utils.utils import genfromstring
+
+# Critical point patterns, compiled once rather than per CP block
+_FLOAT = r'(-?\d+\.?\d+E[\+\-]\d+)'
+_FLOAT_3 = r'\s+'.join([_FLOAT] * 3)
+_CP_TYPE_RE = re.compile(r'Type = \(([\-\+]?[1-3]),([\-\+]?[1-3])\)\s+(\w+)\s+(..+)')
+_CP_COORDS_RE = re.compile(r'Coords\s+=\s+' + _FLOAT_3)
+_CP_RHO_RE = re.compile(r'Rho\s+=\s+' + _FLOAT)
+_CP_GRAD_RHO_RE = re.compile(r'GradRho\s+=\s+' + _FLOAT_3)
+_CP_HESS_EIGENVALS_RE = re.compile(r'HessRho_EigVals\s+=\s+' + _FLOAT_3)
+_CP_HESS_EIGENVECS_RE = re.compile(r'HessRho_EigVec[1-3]\s+=\s+' + _FLOAT_3)
+
+
+def _next_blank_line(buffer, start):
+    """
+    Byte offset of the first blank line at or after ``start``, or the buffer
+        size if there is none. Matches both LF and CRLF line endings, which
+        text-mode streaming used to normalise away.
+
+    :param buffer: Memory-mapped view of the file.
+    :param start: Byte offset to search from.
+    :return: Byte offset of the blank line.
+    """
+    lf = buffer.find(b'\n\n', start)
+    crlf = buffer.find(b'\r\n\r\n', start)
+    if lf == -1:
+        end = crlf
+    elif crlf == -1:
+        end = lf
+    else:
+        end = min(lf, crlf)
+    return end if end != -1 else buffer.size()
+
+
+def _block_following(buffer, position, skip=0):
+    """
+    Slice the text block following the header found at byte offset ``position``,
+        ending at the next blank line, with the header line and ``skip`` further lines removed.
+
+    :param buffer: Memory-mapped view of the file.
+    :param position: Byte offset of the block header.
+    :param skip: Number of lines to discard after the header line.
+    :return: The block contents as a string.
+    """
+    start = buffer.find(b'\n', position) + 1
+    end = _next_blank_line(buffer, start)
+    lines = buffer[start:end].decode('ascii').splitlines(keepends=True)
+    return ''.join(lines[skip:])
 
 
 class AIM:
@@ -17,40 +64,44 @@ class AIM:
 
     @classmethod
     def read(cls, fname):
-
-        # Ideally should do this in a context manager,
-        # but here we close file wrapper manually to avoid a long block of indentation
-        f = open(fname, 'r')
+        # Memory-map the file and jump straight to each block header,
+        # instead of allocating a Python string for every line of the file
+        with open(fname, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
         d = dict(critical_points=[])
-        for line in f:
-            # Nuclear charge & coordinates
-            if line.split() == ['Nuclear', 'Charges', 'and', 'Cartesian', 'Coordinates:']:
-                block = consume_lines(f)
-                d['nuclear_charges'] = genfromstring(block, usecols=(1,), dtype=float)
-                d['coordinates'] = genfromstring(block, usecols=(2, 3, 4), dtype=float)
-
-            # Atomic properties
-            elif line.split() == ['Some', 'Atomic', 'Properties:']:
-                block = consume_lines(f, skip=9)
-                (_, d['atom_charges'], d['atom_lagrangians'], d['atomic_kinetic_energies'],
-                 d['atomic_k_scaled'], d['atomic_dipole_moment']
-                 ) = genfromstring(block, dtype=float, unpack=True, skip_footer=2)
-
-            # Individual critical points
-            elif line[:3] == 'CP#':
-                header_line = copy(line)
-                block = header_line + consume_lines(f, skip=0)
-                d['critical_points'].append(CriticalPoint.from_aimall(block))
-
-            # Atomic electron populations
-            elif line.split() == 'Atomic Electron Populations, Localization and Delocalization Data:'.split():
-                block = consume_lines(f, 16)
-                d['electron_pop'], d['localized_electron_pop'] = genfromstring(
-                    block, usecols=(1,2), dtype=float, unpack=True, skip_footer=2
-                )
-
-        f.close()
+
+        # Nuclear charge & coordinates
+        position = buffer.find(b'Nuclear Charges and Cartesian Coordinates:')
+        if position != -1:
+            block = _block_following(buffer, position, skip=3)
+            d['nuclear_charges'] = genfromstring(block, usecols=(1,), dtype=float)
+            d['coordinates'] = genfromstring(block, usecols=(2, 3, 4), dtype=float)
+
+        # Atomic properties
+        position = buffer.find(b'Some Atomic Properties:')
+        if position != -1:
+            block = _block_following(buffer, position, skip=9)
+            (_, d['atom_charges'], d['atom_lagrangians'], d['atomic_kinetic_energies'],
+             d['atomic_k_scaled'], d['atomic_dipole_moment']
+             ) = genfromstring(block, dtype=float, unpack=True, skip_footer=2)
+
+        # Individual critical points, each running from its CP# header to the next blank line
+        position = buffer.find(b'\nCP#')
+        while position != -1:
+            end = _next_blank_line(buffer, position + 1)
+            d['critical_points'].append(CriticalPoint.from_aimall(buffer[position + 1:end].decode('ascii')))
+            position = buffer.find(b'\nCP#', end)
+
+        # Atomic electron populations
+        position = buffer.find(b'Atomic Electron Populations, Localization and Delocalization Data:')
+        if position != -1:
+            block = _block_following(buffer, position, skip=16)
+            d['electron_pop'], d['localized_electron_pop'] = genfromstring(
+                block, usecols=(1, 2), dtype=float, unpack=True, skip_footer=2
+            )
+
+        buffer.close()
         return cls(fname, **d)
 
 
@@ -71,29 +122,17 @@ class CriticalPoint:
     @classmethod
     def from_aimall(cls, string):
         # type of critical point and related atoms
-        point_type_1, point_type_2, critical_type, atoms_text = re.search(
-            r'Type = \(([\-\+]?[1-3]),([\-\+]?[1-3])\)\s+(\w+)\s+(..+)', string
-        ).groups()
+        point_type_1, point_type_2, critical_type, atoms_text = _CP_TYPE_RE.search(string).groups()
         related_atoms = np.array(re.findall(r'\d+', atoms_text), dtype=int)
 
         # coordinates of this critical point
-        coords = np.array(re.search(
-            r'Coords\s+=\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)', string
-        ).groups(), dtype=float)
+        coords = np.array(_CP_COORDS_RE.search(string).groups(), dtype=float)
 
         # other info
-        rho = float(re.search(
-            r'Rho\s+=\s+(-?\d+\.?\d+E[\+\-]\d+)', string
-        ).group(1))
-        grad_rho = np.array(re.search(
-            r'GradRho\s+=\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)', string
-        ).groups(), dtype=float)
-        hess_eigenvals = np.array(re.search(
-            r'HessRho_EigVals\s+=\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)', string
-        ).groups(), dtype=float)
-        hess_eigenvectors = np.array(
-            re.findall(r'HessRho_EigVec[1-3]\s+=\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)\s+(-?\d+\.?\d+E[\+\-]\d+)', string), dtype=float
-        )
+        rho = float(_CP_RHO_RE.search(string).group(1))
+        grad_rho = np.array(_CP_GRAD_RHO_RE.search(string).groups(), dtype=float)
+        hess_eigenvals = np.array(_CP_HESS_EIGENVALS_RE.search(string).groups(), dtype=float)
+        hess_eigenvectors = np.array(_CP_HESS_EIGENVECS_RE.findall(string), dtype=float)
 
         return cls(coords, (point_type_1, point_type_2), critical_type, related_atoms,
                    rho, grad_rho, hess_eigenvals, hess_eigenvectors
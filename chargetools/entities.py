@@ -1,17 +1,30 @@
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import os
 import itertools
 import re
 
 import numpy as np
-from copy import deepcopy
 
-from collections import Iterable
-from scipy.spatial.distance import cdist
+from collections.abc import Iterable
 
-from chargetools import constants, grids
+from chargetools import _kernels, constants, grids
 from chargetools.exceptions import InputError
-from chargetools.utils.utils import int_if_close, atomic_number_to_symbol, symbol_to_atomic_number
+from chargetools.utils.utils import int_if_close, int_if_close_array, \
+    atomic_number_to_symbol, symbol_to_atomic_number
+
+
+# Atom descriptions combine symbol and label, e.g. N1, C2, Cl3; the symbol is the leading letters
+_ATOM_SYMBOL_RE = re.compile(r'[A-Z][a-z]?')
+
+
+def _symbol_from_atom_str(atom_str):
+    """Extract the element symbol from an atom description such as ``N1`` or ``Cl2``."""
+    # fast path: a leading capital, optionally followed by one lower-case letter
+    symbol = atom_str[0:2] if atom_str[1:2].islower() else atom_str[0:1]
+    if symbol and symbol[0].isupper():
+        return symbol
+    match = _ATOM_SYMBOL_RE.search(atom_str)
+    return match.group(0) if match else None
 
 
 class Atom(object):
@@ -64,7 +77,7 @@ class Atom(object):
         :return: A deep copy of the input ``Atom``.
         """
         return cls(atom.label, atom.atomic_number, atom.charge,
-                   deepcopy(atom.position))
+                   atom.position.copy() if atom.position is not None else None)
 
     @classmethod
     def from_ac_line(cls, ac_line_string):
@@ -82,8 +95,7 @@ class Atom(object):
         charge = int_if_close(float(segments[8]))
 
         # Atom description in the format of Symbol + Label, e.g. N1, C2, etc.
-        # Extract atom symbol by regex
-        symbol = re.findall(r'[A-Z][a-z]?', atom_str)[0]
+        symbol = _symbol_from_atom_str(atom_str)
         return cls(label, symbol_to_atomic_number(symbol), charge, position=position)
 
 
@@ -97,15 +109,8 @@ class Bond(object):
         self.bond_order = bond_order
 
     @classmethod
-    def copy(cls, bond, all_atoms):
-
-        def find_atom_by_label(label, atoms):
-            for _ in atoms:
-                if label == _.label:
-                    return _
-            return None
-
-        return cls(*[find_atom_by_label(atom.label, all_atoms) for atom in bond.bonding_atoms],
+    def copy(cls, bond, atoms_by_label):
+        return cls(*[atoms_by_label[atom.label] for atom in bond.bonding_atoms],
                    bond_order=bond.bond_order)
 
     @classmethod
@@ -145,11 +150,42 @@ class Bond(object):
 
 
 class Molecule(object):
+    # Maps atom property names to the structure-of-arrays attribute caching them
+    _atom_property_arrays = {
+        'label': '_labels',
+        'atomic_number': '_atomic_numbers',
+        'symbol': '_symbols',
+        'charge': '_charges',
+        'position': '_positions',
+    }
+
     def __init__(self, atoms, bonds=None, name=None, charge=0):
         self.atoms = atoms
         self.bonds = bonds
         self.name = name
         self.charge = charge
+        self._rebuild_atom_arrays()
+        # adjacency arrays for the bond graph, built lazily on first use
+        self._adj_indptr, self._adj_indices, self._adj_orders = None, None, None
+
+    def _rebuild_atom_arrays(self):
+        """
+        Build contiguous per-property arrays from ``self.atoms``.
+
+        The molecule keeps a structure-of-arrays copy of the atom properties,
+            so numeric hot paths read dense arrays rather than iterating over
+            ``Atom`` objects. Call this again after mutating atoms directly.
+        """
+        atoms = self.atoms
+        self._label_to_index = {atom.label: index for index, atom in enumerate(atoms)}
+        self._labels = np.array([atom.label for atom in atoms], dtype=int)
+        self._atomic_numbers = np.array([atom.atomic_number for atom in atoms], dtype=int)
+        self._symbols = np.array([atom.symbol for atom in atoms])
+        self._charges = np.array([atom.charge for atom in atoms], dtype=float)
+        if atoms and atoms[0].position is not None:
+            self._positions = np.ascontiguousarray([atom.position for atom in atoms], dtype=float)
+        else:
+            self._positions = None
 
     def __repr__(self):
         d = {
@@ -171,7 +207,9 @@ class Molecule(object):
         atoms = [Atom.copy(atom) for atom in molecule.atoms]
 
         if molecule.bonds:
-            bonds = [Bond.copy(bond, atoms) for bond in molecule.bonds]
+            # One dict build keeps Bond.copy to a hash lookup per bonding atom
+            atoms_by_label = {atom.label: atom for atom in atoms}
+            bonds = [Bond.copy(bond, atoms_by_label) for bond in molecule.bonds]
         else:
             bonds = None
 
@@ -179,43 +217,54 @@ class Molecule(object):
 
     @classmethod
     def from_ac_file(cls, ac_file_name, **kwargs):
-        with open(ac_file_name, 'r') as f:
-            lines = f.readlines()
+        # Single pass classifying lines by their keyword prefix;
+        # AC lines always start with the record keyword, so a prefix test
+        # is both faster and stricter than a substring search
         atom_lines, bond_lines = [], []
-        for line in lines:
-            if 'ATOM' in line:
-                atom_lines.append(line)
-            elif 'BOND' in line:
-                bond_lines.append(line)
-
-        # Read charge from first line
-        # prefer integer if within 0.01 of a whole number
-        charge = int_if_close(
-            float(lines.pop(0).split()[1])
-        )
-
-        # Read atoms
+        with open(ac_file_name, 'r') as f:
+            # Read charge from first line
+            # prefer integer if within 0.01 of a whole number
+            charge = int_if_close(float(f.readline().split()[1]))
+            for line in f:
+                if line.startswith('ATOM'):
+                    atom_lines.append(line)
+                elif line.startswith('BOND'):
+                    bond_lines.append(line)
+
+        # Read atoms, parsing all numeric columns in one C-level pass
         atoms = []
-        for atom_line in atom_lines:
-            atoms.append(Atom.from_ac_line(atom_line))
-
-        # Read bonds
+        if atom_lines:
+            atom_data = np.atleast_1d(
+                np.genfromtxt(atom_lines, usecols=(1, 2, 5, 6, 7, 8), dtype=None, encoding='ascii')
+            )
+            positions = np.stack([atom_data['f2'], atom_data['f3'], atom_data['f4']], axis=1)
+            charges = int_if_close_array(atom_data['f5'])
+            for label, atom_str, position, atom_charge in zip(atom_data['f0'], atom_data['f1'],
+                                                              positions, charges):
+                symbol = _symbol_from_atom_str(atom_str)
+                atoms.append(Atom(label, symbol_to_atomic_number(symbol), atom_charge, position=position))
+
+        # Read bonds, with the label and order columns parsed in one pass as well
         bonds = []
-        for bond_line in bond_lines:
-            bonds.append(Bond.from_ac_line(bond_line, atoms))
+        if bond_lines:
+            bond_data = np.atleast_1d(np.genfromtxt(bond_lines, usecols=(2, 3, 4), dtype=int)).reshape(-1, 3)
+            for label_a, label_b, bond_order in bond_data:
+                bonds.append(Bond(atoms[label_a - 1], atoms[label_b - 1], bond_order=bond_order))
 
         return cls(atoms, bonds=bonds, charge=charge, **kwargs)
 
     @classmethod
     def from_cube_header(cls, header_lines, *args, **kwargs):
-        atoms = []
-        for index, line in enumerate(header_lines):
-            segments = line.split()
-            atomic_number = int(segments[0])
-            atoms.append(Atom(index+1, atomic_number,
-                              charge=int_if_close(float(segments[1]) - atomic_number),
-                              position=np.array(list(map(float, segments[2:]))))
-                         )
+        # Parse the whole atom block in one pass into contiguous columns
+        atom_array = np.array(''.join(header_lines).split(), dtype=float).reshape(-1, 5)
+        atomic_numbers = atom_array[:, 0].astype(int)
+        # the second column stores the nuclear charge, i.e. atomic number plus partial charge
+        atom_charges = int_if_close_array(atom_array[:, 1] - atomic_numbers)
+        atom_positions = np.ascontiguousarray(atom_array[:, 2:5])
+
+        atoms = [Atom(index + 1, atomic_number, atom_charge, position=position)
+                 for index, (atomic_number, atom_charge, position)
+                 in enumerate(zip(atomic_numbers, atom_charges, atom_positions))]
         return cls(atoms, *args, **kwargs)
 
     def select_label(self, *labels):
@@ -230,11 +279,30 @@ class Molecule(object):
     def select_descriptor(self, *descriptors):
         res = []
         for descriptor in descriptors:
-            for atom in self.atoms:
-                if atom.descriptor_compare(descriptor):
-                    res.append(atom)
+            res.extend(self.atoms[index] for index in np.flatnonzero(self._match(descriptor)))
         return res
 
+    def _match(self, descriptor):
+        """
+        Boolean mask over all atoms matching a descriptor.
+
+        Dispatches on the descriptor type once and compares against the cached
+            property arrays, instead of calling ``descriptor_compare`` per atom.
+
+        :param descriptor: An atomic symbol string, an integer label,
+            or an :class:`entities.Atom` object.
+        :rtype: numpy.array
+        :return: Boolean array with one entry per atom.
+        """
+        if isinstance(descriptor, str):
+            return self._symbols == descriptor
+        if isinstance(descriptor, Atom):
+            descriptor = descriptor.label
+        try:
+            return self._labels == int(descriptor)
+        except (TypeError, ValueError):
+            return np.zeros(len(self.atoms), dtype=bool)
+
     def list_of_atom_property(self, property_name):
         """
         Outputs a list of atom properties within field ``property_name`.
@@ -242,10 +310,46 @@ class Molecule(object):
             this function will output a list of atomic numbers ordered by their labels.
         :param property_name: Key of the property of interest.
             Valid properties are: ``atomic_number``, ``label``, ``symbol``, ``position``, ``charge``.
-        :return: List of properties.
+        :return: Array of properties. For the properties above this is the cached
+            array itself, not a fresh list, so callers can consume it directly
+            without another ``np.array(...)`` copy.
         """
+        array_name = self._atom_property_arrays.get(property_name)
+        if array_name is not None:
+            return getattr(self, array_name)
         return [vars(atom)[property_name] for atom in self.atoms]
 
+    def _bond_graph(self):
+        """
+        Lazily build adjacency arrays for the bond graph, in compressed sparse row form.
+
+        :return: Tuple of ``(indptr, indices, orders)`` arrays.
+            Neighbours of the atom at index ``i`` are ``indices[indptr[i]:indptr[i + 1]]``,
+            with the matching bond orders at the same slice of ``orders``.
+        """
+        if self._adj_indptr is None:
+            n_atoms = len(self.atoms)
+            index_by_id = {id(atom): index for index, atom in enumerate(self.atoms)}
+            edges = [[] for _ in range(n_atoms)]
+            for bond in self.bonds or []:
+                bond_indices = [index_by_id[id(bonding_atom)] for bonding_atom in bond.bonding_atoms]
+                for index_a, index_b in itertools.combinations(bond_indices, 2):
+                    edges[index_a].append((index_b, bond.bond_order))
+                    edges[index_b].append((index_a, bond.bond_order))
+
+            counts = np.fromiter((len(edge) for edge in edges), dtype=np.int32, count=n_atoms)
+            flat = list(itertools.chain.from_iterable(edges))
+            self._adj_indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+            self._adj_indices = np.array([index for index, _ in flat], dtype=np.int32)
+            self._adj_orders = np.array([order for _, order in flat], dtype=float)
+        return self._adj_indptr, self._adj_indices, self._adj_orders
+
+    def _neighbours(self, atom_index, min_bond_order=0.):
+        """Indices of atoms bonded to the atom at ``atom_index`` with bond order above the minimum."""
+        indptr, indices, orders = self._bond_graph()
+        start, end = indptr[atom_index], indptr[atom_index + 1]
+        return indices[start:end][orders[start:end] > min_bond_order]
+
     def if_bonded(self, atom, descriptor, min_bond_order=0.):
         """
         Check if argument atoms are bonded within the same bond.
@@ -257,15 +361,9 @@ class Molecule(object):
         :param min_bond_order: Minimum bond order that counts as a chemical `bond`.
         :return: If all argument atoms are bonded in the same bond.
         """
-
-        for i, bond in enumerate(self.bonds):
-            has_atom, has_descriptor = False, False
-            for bonding_atom in bond.bonding_atoms:
-                if bonding_atom.descriptor_compare(atom):
-                    has_atom = True
-                elif bonding_atom.descriptor_compare(descriptor):
-                    has_descriptor = True
-            if has_atom and has_descriptor:
+        target_mask = self._match(descriptor)
+        for atom_index in np.flatnonzero(self._match(atom)):
+            if target_mask[self._neighbours(atom_index, min_bond_order)].any():
                 return True
         return False
 
@@ -274,40 +372,47 @@ class Molecule(object):
         Select all atoms bonded to the input atom.
 
         :param min_bond_order: Minimum bond order with which an atom is bonded, for the atom to be included.
-        :param atom: Atom descriptors, can be either:
+        :param atom: can be either:
             *. a string of atom symbols, in which case all atoms with that atomic symbol count as being included.
             *. an integer of the atom's label.
             *. an atom object, in which case its label will be compared rather than an identity comparison.
         :return: A list of all bonded atoms.
         """
-        bonded_atoms = []
-        for bond in self.bonds:
-            if bond.contains(atom):
-                bonded_atoms += [bonding_atom for bonding_atom in bond.bonding_atoms
-                                 if bonding_atom is not atom and bond.bond_order > min_bond_order]
-        return bonded_atoms
+        matched = np.flatnonzero(self._match(atom))
+        if not matched.size:
+            return []
+        neighbours = np.unique(np.concatenate(
+            [self._neighbours(atom_index, min_bond_order) for atom_index in matched]))
+        return [self.atoms[neighbour] for neighbour in neighbours]
 
     def number_connections(self, atom_a, atom_b, min_bond_order=0.):
         """
-        Get the number of bonds connecting atom A and atom B.
+        Get the number of bonds connecting atom A and atom B,
+            i.e. the number of edges on the shortest path through the bond graph.
 
         :param atom_a: Atom A, must be an :class:`entities.Atom` object.
         :param atom_b: Atom B, must be an :class:`entities.Atom` object.
         :param min_bond_order: Minimum bond order for a connection to be counted.
-        :return: Number of chemical bonds between two input atoms.
+        :return: Number of chemical bonds between two input atoms, or infinity if not connected.
         """
-
-        def iter_atoms(_a, _b, n, min_bond_order_, stop):
-            if _a in self.select_bonded(_b, min_bond_order_):
-                return n
-            else:
-                _n = n + 1
-                if _n > stop:
-                    return float("inf")
-                for bonded in self.select_bonded(_b):
-                    return iter_atoms(_a, bonded, _n, min_bond_order_, stop)
-
-        return iter_atoms(atom_a, atom_b, 1, min_bond_order, len(self.bonds))
+        source, target = self.atoms.index(atom_a), self.atoms.index(atom_b)
+        if source == target:
+            return 0
+
+        # breadth-first search, O(atoms + bonds) rather than the bond-list rescan per step
+        visited = np.zeros(len(self.atoms), dtype=bool)
+        visited[source] = True
+        queue = deque([(source, 0)])
+        while queue:
+            current, n_connections = queue.popleft()
+            for neighbour in self._neighbours(current, min_bond_order):
+                if visited[neighbour]:
+                    continue
+                if neighbour == target:
+                    return n_connections + 1
+                visited[neighbour] = True
+                queue.append((neighbour, n_connections + 1))
+        return float("inf")
 
 
 class MoleculeWithCharge(Molecule):
@@ -325,6 +430,25 @@ class MoleculeWithCharge(Molecule):
         ),
     }
 
+    # One compiled alternation per category, so guessing scans each candidate string
+    # in C once per category instead of looping Python-level over every identifier
+    _sampling_scheme_res = OrderedDict(
+        (name, re.compile('|'.join(map(re.escape, identifiers))))
+        for name, identifiers in all_sampling_schemes.items()
+    )
+    _charge_method_res = OrderedDict(
+        (name, re.compile('|'.join(map(re.escape, identifiers))))
+        for name, identifiers in all_charge_methods.items()
+    )
+
+    @staticmethod
+    def _search_identifiers(patterns, string):
+        """Return the first category whose compiled identifier pattern matches, or ``None``."""
+        for name, pattern in patterns.items():
+            if pattern.search(string):
+                return name
+        return None
+
     def __init__(self, charge_file_name, atoms,
                  charge_method=None,
                  sampling_scheme=None,
@@ -357,93 +481,65 @@ class MoleculeWithCharge(Molecule):
         self.is_equivalenced = "equivalence" in file_name or self.is_restrained
         self.is_compromised = "compromise" in file_name
 
-        found = False
-        for sampling_scheme_name, sampling_scheme_identifiers in self.all_sampling_schemes.items():
-            for sampling_scheme_identifier in sampling_scheme_identifiers:
-                if sampling_scheme_identifier.lower() in file_name:
-                    self.sampling_scheme = sampling_scheme_name
-                    found = True
-                    break
-            if found:
-                break
-        else:
-            self.sampling_scheme = None
-
-        found = False
-        for charge_method, charge_method_identifiers in self.all_charge_methods.items():
-            for charge_method_identifier in charge_method_identifiers:
-                if charge_method_identifier.lower() in file_name:
-                    self.charge_method = charge_method
-                    found = True
-                    break
-            if found:
-                break
-        else:
-            self.charge_method = None
+        self.sampling_scheme = self._search_identifiers(self._sampling_scheme_res, file_name)
+        self.charge_method = self._search_identifiers(self._charge_method_res, file_name)
 
     @classmethod
     def from_plaintext_list(cls, file_name_full, base_molecule, *args, **kwargs):
         with open(file_name_full, 'r') as f:
             line = f.read()
 
-        if len(line.split()) != len(base_molecule):
+        charge_strs = line.split()
+        if len(charge_strs) != len(base_molecule):
             raise InputError('The list-formatted charge file must have the same number of list as the base molecule. '
                              'The base molecule (.ac file?) may point to a different molecule than this charges list.')
 
         molecule = Molecule.copy(base_molecule)
         charge = 0
-        for atom, charge_str in zip(molecule.atoms, line.split()):
-            atom.charge = int_if_close(float(charge_str))
-            charge += float(charge_str)
+        for atom, charge_str in zip(molecule.atoms, charge_strs):
+            atom_charge = float(charge_str)
+            atom.charge = int_if_close(atom_charge)
+            charge += atom_charge
 
         return cls(file_name_full, molecule.atoms, bonds=molecule.bonds,
                    charge=int_if_close(charge), name=molecule.name, *args, **kwargs)
 
     @classmethod
     def from_gaussian_log(cls, file_name_full, base_molecule, *args, **kwargs):
-        with open(file_name_full, 'r') as f:
-            lines = f.readlines()
+        molecule = Molecule.copy(base_molecule)
+        remaining_atoms = iter(molecule.atoms)
 
-        # Locate starting point of ESP charges text block
-        try:
-            start_index = lines.index(" ESP charges:\n") + 2
-        except ValueError:
-            raise InputError('Cannot find charge information within this Gaussian log file.')
+        sampling_scheme = None
+        in_charge_block = False
+        total_charge_str = '0'
 
-        # Parse the input keywords to find the sampling scheme
-        sampling_scheme = False
-        for line in lines[58:158]:
-            if sampling_scheme:
-                break
-            for segment in line.split():
-                if "pop=" in segment:
-                    # look if keyword contains default set of keywords
-                    for name, identifiers in cls.all_sampling_schemes.items():
-                        if sampling_scheme:
-                            break
-                        for identifier in identifiers:
-                            if identifier.lower() in segment.lower():
-                                sampling_scheme = name
-                            if sampling_scheme:
-                                break
+        # Single pass over the file: scan route lines for the sampling scheme,
+        # then switch to reading charges once the ESP block header is reached
+        with open(file_name_full, 'r') as f:
+            for line in f:
+                if not in_charge_block:
+                    if line == " ESP charges:\n":
+                        in_charge_block = True
+                        next(f, None)  # skip the column header line
+                    elif sampling_scheme is None and "pop=" in line.lower():
+                        sampling_scheme = cls._search_identifiers(cls._sampling_scheme_res, line.lower())
+                    continue
+
+                segments = line.split()
+                if segments[:4] == ['Sum', 'of', 'ESP', 'charges']:
+                    total_charge_str = segments[-1]
+                    break
+                if len(segments) >= 3:
+                    atom = next(remaining_atoms, None)
+                    if atom is None:
+                        break
+                    atom.charge = int_if_close(float(segments[-1]))
 
+        if not in_charge_block:
+            raise InputError('Cannot find charge information within this Gaussian log file.')
         if not sampling_scheme:
             raise InputError('Cannot find sampling scheme information within this Gaussian log file.')
 
-        molecule = Molecule.copy(base_molecule)
-        for atom, line in zip(molecule.atoms, lines[start_index:]):
-            if "Sum of ESP charges" in line:
-                total_charge_str = line.split()[-1]
-                break
-            if len(line.split()) >= 3:
-                charge_str = line.split()[-1]
-                atom.charge = int_if_close(float(charge_str))
-
-        try:
-            total_charge_str
-        except NameError:
-            total_charge_str = '0'
-
         return cls(file_name_full, molecule.atoms, bonds=molecule.bonds,
                    charge=int_if_close(float(total_charge_str)),
                    is_averaged=False, is_compromised=False, is_equivalenced=False, is_restrained=False)
@@ -465,48 +561,73 @@ class MoleculeWithCharge(Molecule):
     def mulliken_from_gaussian_log(cls, file_name_full, base_molecule):
         pass
 
-    @property
     def charge_on(self, atom_label):
         """
         Output charge borne by a labelled atom.
         """
-        for atom in self.atoms:
-            if atom.label == atom_label:
-                return atom.charge
-        raise ValueError('Atom with this label has not been found.')
+        try:
+            return self._charges[self._label_to_index[atom_label]]
+        except KeyError:
+            raise ValueError('Atom with this label has not been found.')
 
-    def reproduce_cube(self, template_cube,  **kwargs):
+    def reproduce_cube(self, template_cube, dtype=np.float32):
         """
         Based on the respective charges of atoms within this molecule,
             reproduce the 3-dimensional electrostatic potential as a :class:`charges.cube.Cube` object.
 
         :param template_cube: The reproduced volume will have the same points density and size to this template cube.
-        :param kwargs: Extra keyword arguments to pass to the :func:`scipy.spatial.distance.cdist` function,
-            which calculates the distances.
-            By default, the Euclidean distances are used.
+        :param dtype: Data type used throughout the reconstruction. Single precision
+            halves memory traffic and matches the cube's own default storage;
+            pass ``numpy.float64`` if full precision is required.
         :return: Reproduced potential stored within a new :class:`charges.cube.Cube` object.
         """
-        atomic_charges = np.array(self.list_of_atom_property('charge'))
-        positions = np.array(template_cube.molecule.list_of_atom_property('position'))
-
-        # Calculate the distances
-        distances = cdist(template_cube.flat_coordinates, positions, **kwargs)
-        # Calculate per-atom potential, then sum
-        potentials = (np.array(atomic_charges) / distances).sum(axis=1)
-
-        return grids.Cube.assign_new_values_to(template_cube, potentials.reshape(template_cube.n_voxels))
-
-    def error_cube(self, potential, **kwargs):
+        atomic_charges = np.asarray(self.list_of_atom_property('charge'), dtype=dtype)
+        positions = np.ascontiguousarray(
+            template_cube.molecule.list_of_atom_property('position'), dtype=dtype)
+        if len(atomic_charges) != len(positions):
+            raise InputError('Molecule carries {0} charges but the template cube stores {1} atoms; '
+                             'the cube must describe the same molecule.'
+                             .format(len(atomic_charges), len(positions)))
+        coordinates = np.asarray(template_cube.flat_coordinates, dtype=dtype)
+
+        if _kernels.HAS_CUDA and coordinates.shape[0] > _kernels.GPU_MIN_VOXELS:
+            # Massive grids are embarrassingly parallel over points and
+            # bandwidth-bound on the CPU, so hand them to the GPU
+            potentials = _kernels.esp_grid_gpu(coordinates, positions, atomic_charges)
+        elif _kernels.HAS_NUMBA and coordinates.shape[0] * len(atomic_charges) > _kernels.ESP_KERNEL_MIN_WORK:
+            # For large grids, a fused kernel accumulates charge / distance per point
+            # in registers, with no voxels-by-atoms intermediate at all
+            potentials = np.empty(coordinates.shape[0], dtype=dtype)
+            _kernels.esp_grid(np.ascontiguousarray(coordinates), positions, atomic_charges, potentials)
+        else:
+            # Calculate the distances through BLAS matrix products, tiled over
+            # points so each block stays cache-resident and only one
+            # tile-by-atoms buffer is ever allocated
+            tile = 8192
+            n_points = coordinates.shape[0]
+            potentials = np.empty(n_points, dtype=dtype)
+            block = np.empty((min(tile, n_points), len(positions)), dtype=dtype)
+            for start in range(0, n_points, tile):
+                stop = min(start + tile, n_points)
+                distances = grids.pairwise_squared_distances(
+                    coordinates[start:stop], positions, out=block[:stop - start])
+                # 1/sqrt in a single in-place ufunc pass over the tile
+                np.power(distances, -0.5, out=distances)
+                # Summing charge / distance over atoms is a matrix-vector product, fused inside BLAS
+                np.matmul(distances, atomic_charges, out=potentials[start:stop])
+
+        # build the cube directly: assign_new_values_to would fold the result
+        # back to the template's storage dtype, defeating the dtype argument
+        return grids.Cube(template_cube.from_file, template_cube.field_type,
+                          potentials.reshape(template_cube.n_voxels), *template_cube._grid_args)
+
+    def error_cube(self, potential):
         """
         Based on the respective charges of atoms within this molecule,
             calculate the 3D electrostatic potential subtracted by the actual potential values.
             This is a wrapper function for the :method:`entities.MoleculeWithCharge.reproduceCube` method.
 
         :param potential: A :class:`grids.Cube` object containing the actual potential.
-        :param kwargs: Extra keyword arguments to be passed to the distance transform method,
-            from which distances to atoms are evaluated.
         :return: Cube object containing errors of the electrostatic potential.
         """
-        return grids.Cube.assign_new_values_to(potential,
-                                               self.reproduce_cube(potential, **kwargs) - potential,
-                                               )
+        return self.reproduce_cube(potential) - potential
@@ -1,4 +1,5 @@
 import os
+import re
 
 import numpy as np
 import periodictable
@@ -50,12 +51,12 @@ class GaussianInput:
         title = sections[1]
         charge, multiplicity = map(int, re.match(r"(\d+)\s+(\d+)", sections[2]).groups())
 
-        symbols, coords = [], []
-        for line in sections[2].split('\n')[1:]:
-            symbol, *coord = line.split()
-            symbols.append(symbol)
-            coords.append(np.array(coord, dtype=np.float))
-        symbols, coords = np.array(symbols), np.array(coords)
+        # Parse the whole coordinate block in one C-level pass
+        data = np.atleast_1d(np.genfromtxt(sections[2].split('\n')[1:],
+                                           dtype=None, encoding='ascii',
+                                           names=('symbol', 'x', 'y', 'z')))
+        symbols = data['symbol']
+        coords = np.stack([data['x'], data['y'], data['z']], axis=1)
 
         extras = [section for section in sections[3:] if section != '']
         return cls(link0, routes, symbols, coords, charge, multiplicity, title, extras)
@@ -81,43 +82,38 @@ class GaussianInput:
             if os.path.exists(fname):
                 return
 
-        lines = []
-
-        for header, value in self.link0.items():
-            if value is None:
-                lines.append('%{}'.format(header))
-            else:
-                lines.append('%{}={}'.format(header, value))
-
-        route_str = "# "
-        for keyword, value in self.routes.items():
-            if value is None:
-                route_str += keyword + " "
-            else:
-                route_str += "{}={} ".format(keyword, value)
-        lines.append(route_str)
-        lines.append('')
-
-        lines.append(self.title + "\n")
-
-        lines.append('{} {}'.format(self.charge, self.multiplicity))
-        for atom_symbol, atom_coord in zip(self.atom_symbols, self.atom_coords):
-            lines.append(
-                ' {}                  {:11.8f}    {:11.8f}    {:11.8f}'.format(atom_symbol, *list(atom_coord))
-            )
-        lines.append('')
-
-        for extra in self.extras:
-            lines.append(extra)
-            lines.append('')
-
-        lines.append('')
-
         if "." not in fname:
             fname += ".com"
 
-        with open(fname, 'wb') as f:
-            f.write('\n'.join(lines).encode())
+        # Stream each section straight to a generously buffered text file,
+        # instead of accumulating the whole output in memory first
+        with open(fname, 'w', buffering=1 << 20) as f:
+            for header, value in self.link0.items():
+                if value is None:
+                    f.write('%{}\n'.format(header))
+                else:
+                    f.write('%{}={}\n'.format(header, value))
+
+            route_str = "# "
+            for keyword, value in self.routes.items():
+                if value is None:
+                    route_str += keyword + " "
+                else:
+                    route_str += "{}={} ".format(keyword, value)
+            f.write(route_str + '\n\n')
+
+            f.write(self.title + '\n\n')
+
+            f.write('{} {}\n'.format(self.charge, self.multiplicity))
+            # Format the whole atom block in one C-level pass rather than
+            # one Python format call per atom
+            coords = np.asarray(self.atom_coords, dtype=float)
+            atom_block = np.rec.fromarrays([np.asarray(self.atom_symbols), *coords.T])
+            np.savetxt(f, atom_block, fmt=' %s                  %11.8f    %11.8f    %11.8f')
+            f.write('\n')
+
+            for extra in self.extras:
+                f.write(extra + '\n\n')
 
         if verbose:
             print("Successfully saved Gaussian input file {}".format(os.path.basename(fname)))
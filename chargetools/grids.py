@@ -1,13 +1,41 @@
-from collections import OrderedDict
-import itertools
+import os
+from functools import cached_property
 
 import numpy as np
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 
+from chargetools import _kernels
 from chargetools.constants import AXES_NAMES
 from chargetools.exceptions import InputError
 from chargetools.utils.utils import chained_or
 
+# Operand types the cube arithmetic accepts besides other cubes
+_NUMERIC_TYPES = (int, float, np.ndarray, np.floating, np.integer)
+
+
+def pairwise_squared_distances(points, positions, out=None):
+    """
+    Squared Euclidean distances between two point sets,
+        computed through the ``||p - q||^2 = p.p + q.q - 2 p.q`` factorisation.
+
+    The dominant cross term is a single matrix product, which runs inside the
+        vendor-tuned BLAS GEMM kernel instead of an element-wise distance loop.
+
+    :param points: (N, 3) array of grid points.
+    :param positions: (M, 3) array of atom positions.
+    :param out: Optional preallocated (N, M) buffer; the whole computation
+        happens in place within it, with no further allocation.
+    :rtype: numpy.array
+    :return: (N, M) array of squared distances.
+    """
+    points, positions = np.asarray(points), np.asarray(positions)
+    out = np.matmul(points, positions.T, out=out)
+    out *= -2.
+    out += np.einsum('ij,ij->i', points, points)[:, None]
+    out += np.einsum('ij,ij->i', positions, positions)[None, :]
+    # rounding in the subtraction can leave tiny negative values behind
+    return np.maximum(out, 0., out=out)
+
 
 class Cube(object):
     """
@@ -23,12 +51,17 @@ class Cube(object):
         self.from_file = file_name
         self.field_type = field_type
         self.values = values
-        self.axes = axes
+        # cache the axes as contiguous 1D arrays, so hot paths can grab them
+        # without rebuilding lists from a mapping on every call
+        if isinstance(axes, dict):
+            axes = axes.values()
+        self._axes_xyz = tuple(np.ascontiguousarray(axis) for axis in axes)
         self.molecule = molecule
         self.origins, self.unit_vectors, self.n_voxels = origins, unit_vectors, n_voxels
 
     @classmethod
-    def from_cube_file(cls, file_name, base_molecule=None, header_only=False, field_type="potential"):
+    def from_cube_file(cls, file_name, base_molecule=None, header_only=False, field_type="potential",
+                       dtype=np.float32, cache=True):
         """
         Instantiate a ``Cube`` object by reading from a stored Gaussian cube (``.cub``) file.
 
@@ -42,54 +75,108 @@ class Cube(object):
         :param base_molecule: Give a base molecule related to this cube.
             Otherwise, the Gaussian cube file header will be parsed into a :class:`charges.molecule.Molecule`.
             Note the header only contains minimal information about the molecule.
+        :param dtype: Data type for the stored values. Defaults to single precision,
+            which is enough for the 5 significant figures stored in cube files
+            and halves memory traffic for all cube arithmetic.
+            Pass ``numpy.float64`` if full precision is required downstream.
+        :type cache: bool
+        :param cache: If True, the parsed values are saved to a ``.npy`` side-file next to the cube,
+            and subsequent reads memory-map that binary cache instead of reparsing the ASCII values.
+            The cache is invalidated whenever the cube file is newer than the side-file.
 
         :rtype: charges.cube.Cube
         :return: A :class:`charges.cube.Cube` object.
         """
 
         with open(file_name, 'r') as f:
-            lines = f.readlines()
-
-        # Read the number of atoms and the origin of the volumetric data
-        origin_line = lines[2].split()
-        n_atoms = int(origin_line[0])
-        origins = np.array(list(map(float, origin_line[1:4])))
-
-        # Read the unit vectors and number of voxels per line
-        unit_vectors = []
-        n_voxels = []
-        for line in lines[3:6]:
-            segments = line.split()
-            vector = map(float, segments[1:])
-            for scalar_length in vector:
-                # only support orthogonal axes for now
-                if abs(scalar_length - 0.) >= 0.01:
-                    unit_vectors.append(scalar_length)
-            n_voxels.append(int(line.split()[0]))
-        unit_vectors, n_voxels = np.array(unit_vectors), np.array(n_voxels)
-
-        # Store atom positions
-        if base_molecule is None:
-            atom_header = lines[6:6+n_atoms]
-            from chargetools.entities import Molecule
-            base_molecule = Molecule.from_cube_header(atom_header)
-
-        # Create a 1-dimensional flat array containing values in the .cub file
-        if header_only:
-            values = np.empty(n_voxels)
-        else:
-            value_str = ''.join(lines[6+n_atoms:])
-            values = np.fromstring(value_str, sep=" ").reshape(n_voxels)
+            # The header is small: two comment lines, one origin line and three axis lines
+            header_lines = [f.readline() for _ in range(6)]
+
+            # Read the number of atoms and the origin of the volumetric data
+            origin_line = np.array(header_lines[2].split(), dtype=float)
+            n_atoms = int(origin_line[0])
+            origins = origin_line[1:4]
+
+            # Bulk-parse the three axis lines, each holding a voxel count followed by an axis vector
+            axes_header = np.array(''.join(header_lines[3:6]).split(), dtype=float).reshape(3, 4)
+            n_voxels = axes_header[:, 0].astype(int)
+            # only support orthogonal axes for now, so unit vectors lie on the diagonal
+            axis_vectors = axes_header[:, 1:4]
+            unit_vectors = np.diag(axis_vectors)
+            off_diagonal = np.abs(axis_vectors - np.diag(unit_vectors)) >= 0.01
+            if off_diagonal.any():
+                raise InputError('Only cube files with orthogonal axes are supported.')
+
+            # Store atom positions
+            atom_header = [f.readline() for _ in range(n_atoms)]
+            if base_molecule is None:
+                from chargetools.entities import Molecule
+                base_molecule = Molecule.from_cube_header(atom_header)
+
+            # Stream the remainder of the file straight into a flat array,
+            # without building a second full-size copy of the text in memory
+            if header_only:
+                values = np.empty(n_voxels, dtype=dtype)
+            else:
+                values = None
+                sidecar_path = file_name + '.npy'
+                if cache and os.path.isfile(sidecar_path) \
+                        and os.path.getmtime(sidecar_path) >= os.path.getmtime(file_name):
+                    cached = np.load(sidecar_path, mmap_mode='r')
+                    if cached.dtype == dtype and cached.shape == tuple(n_voxels):
+                        values = cached
+                if values is None:
+                    values = cls._read_values(f, n_voxels, dtype)
+                    if cache:
+                        try:
+                            np.save(sidecar_path, values)
+                        except OSError:
+                            # the side-file is a best-effort cache;
+                            # an unwritable directory should not break parsing
+                            pass
+                        else:
+                            # swap the dense parse result for a memory-mapped view
+                            # of the side-file, so first and repeat reads behave
+                            # the same and resident memory stays pagecache-bound
+                            values = np.load(sidecar_path, mmap_mode='r')
 
         # Create 1D arrays describing 3 coordinates
-        axes = OrderedDict()
-        zipped_axes_attributes = zip(AXES_NAMES, origins, unit_vectors, n_voxels)
-        for axis_name, origin, unit_vector, n_voxel in zipped_axes_attributes:
-            axes[axis_name] = np.arange(0, n_voxel) * unit_vector + origin
+        axes = tuple(np.arange(0, n_voxel) * unit_vector + origin
+                     for origin, unit_vector, n_voxel in zip(origins, unit_vectors, n_voxels))
 
         return cls(file_name, field_type, values, axes, base_molecule,
                    origins, unit_vectors, n_voxels)
 
+    @staticmethod
+    def _read_values(f, n_voxels, dtype):
+        """
+        Read the whitespace-separated value block from an open cube file handle.
+
+        Uses the multi-stage C tokenizer in pandas when it is available,
+            streaming fixed-size chunks into one preallocated array;
+            otherwise falls back to a plain ``np.fromfile`` parse.
+        """
+        n_values = int(np.prod(n_voxels))
+        try:
+            import pandas
+        except ImportError:
+            return np.fromfile(f, dtype=dtype, sep=' ', count=n_values).reshape(n_voxels)
+
+        values = np.empty(n_values, dtype=dtype)
+        offset = 0
+        reader = pandas.read_csv(f, sep=r'\s+', header=None, names=range(6),
+                                 dtype=dtype, chunksize=1 << 20, engine='c')
+        for chunk in reader:
+            flat = chunk.values.ravel()
+            # short rows at the end of each z-run are padded with NaN by the tokenizer
+            flat = flat[~np.isnan(flat)]
+            values[offset:offset + flat.size] = flat
+            offset += flat.size
+        if offset != n_values:
+            raise InputError('Cube file ended after {0} of the {1} values '
+                             'promised by its header.'.format(offset, n_values))
+        return values.reshape(n_voxels)
+
     def save(self, file_path):
         with open(file_path, 'x') as f:
             # meta data
@@ -106,23 +193,25 @@ class Cube(object):
                                ['{0: .6f}'.format(0.)] * (len(self.unit_vectors) - index - 1)
                 f.write(" {0:4}   {1}\n".format(n_voxel, '   '.join(unit_vectors)))
 
-            # lines for atomic data: atomic number, charge, then positions
-            for atom in self.molecule.atoms:
-                f.write(' {0:4}   {1: .6f}   {2: .6f}   {3: .6f}   {4: .6f}\n'.format(
-                    atom.atomic_number, atom.atomic_number + atom.charge, *atom.position))
-
-            # write actual field values
-            for counter, value in enumerate(self.values.flatten(), start=1):
-                s = (' {0: .5E}'.format(value))
-
-                # cube file format requires line break every 6 values
-                if not counter % 6:
-                    s += '\n'
-                # cube file format requires line break after every z value has been depleted for x_i, y_j
-                elif not counter % self.n_voxels[-1]:
-                    s += '\n'
-
-                f.write(s)
+            # lines for atomic data: atomic number, charge, then positions,
+            # formatted in one C-level pass over the cached atom arrays
+            molecule = self.molecule
+            np.savetxt(f, np.column_stack([molecule.list_of_atom_property('atomic_number'),
+                                           molecule.list_of_atom_property('atomic_number')
+                                           + molecule.list_of_atom_property('charge'),
+                                           molecule.list_of_atom_property('position')]),
+                       fmt=' %4d   % .6f   % .6f   % .6f   % .6f')
+
+            # write actual field values, formatting every value at once
+            # instead of one Python format call and write per voxel
+            flat = np.asarray(self.values).ravel()
+            tokens = np.char.mod(' % .5E', flat)
+            counters = np.arange(1, flat.size + 1)
+            # cube file format requires line break every 6 values,
+            # and after every z value has been depleted for x_i, y_j
+            breaks = (counters % 6 == 0) | (counters % self.n_voxels[-1] == 0)
+            tokens = np.char.add(tokens, np.where(breaks, '\n', ''))
+            f.write(''.join(tokens))
 
     def plot(self, distance=200, global_max=None, grid=True, **kwargs):
         from pyqtgraph.Qt import QtCore, QtGui
@@ -163,42 +252,67 @@ class Cube(object):
         args = (original_cube.axes, original_cube.molecule,
                 original_cube.origins, original_cube.unit_vectors, original_cube.n_voxels,
                 )
+        new_values = np.asarray(new_values, dtype=original_cube.values.dtype)
         return cls(original_cube.from_file, original_cube.field_type, new_values, *args)
 
     @property
-    def meshgrid(self, sparse=False):
+    def axes(self):
+        """Mapping of axis name (``x``, ``y``, ``z``) to the 1D array of coordinates along that axis."""
+        return dict(zip(AXES_NAMES, self._axes_xyz))
+
+    @cached_property
+    def meshgrid(self):
         """
         Returns coordinates matrices of the 3D Cartesian volumes.
         See `https://docs.scipy.org/doc/numpy/reference/generated/numpy.meshgrid.html` for details.
 
-        For example, the x-axis meshgrid will contain
-            [[x1 repeated for i times, where i is the number of points on the y axis],
-             [x2 repeated for j times, where j is the number of points on the z axis],
-             ...
-             [xn ... i times], [xm ... j times] where n is the number of points on the x axis
-            ]
+        The grids are returned sparse, with shapes (n, 1, 1), (1, m, 1) and
+            (1, 1, k): arithmetic between them broadcasts to the full volume
+            without ever allocating three dense 3D arrays.
 
         :rtype: tuple of numpy arrays
-        :return: N-D coordinate arrays for vectorised N-D scalar fields over N-D grids,
+        :return: Sparse N-D coordinate arrays for vectorised N-D scalar fields over N-D grids,
             given the stored N 1D coordinate arrays x1 ... xn, y1 ... yn, z1 ... zn.
         """
-        return np.meshgrid(*list(self.axes.values()), sparse=sparse)
+        return np.meshgrid(*self._axes_xyz, sparse=True, indexing='ij')
 
-    @property
+    @cached_property
     def flat_coordinates(self):
         """
         Returns a 1D array of N-coordinates of each point.
 
+        Computed once per cube and cached: repeated reconstruction calls
+            (e.g. fitting loops) reuse the same array.
+
         :rtype: numpy.array
         :return: A numpy array which contains the value of coordinates at all three dimensions,
             i.e. [x1, y1, z1], [x2, y2, z2], ... [xn, yn, zn].
         """
-        meshgrid = np.array(self.meshgrid)
-        return np.vstack(meshgrid.reshape(len(self.axes), -1)).T
+        # broadcast views of the 1D axes are stacked straight into the output,
+        # avoiding materialising three dense 3D meshgrid arrays first
+        return np.stack(np.meshgrid(*self._axes_xyz, indexing='ij', copy=False),
+                        axis=-1).reshape(-1, len(self._axes_xyz))
 
-    def filter_values(self, condition, replace_with=np.nan):
+    def _iter_flat_blocks(self, block=1 << 16):
         """
-        Make a new numpy array containing values in the 3D volume,
+        Yield the flat grid coordinates one x-slab at a time.
+
+        Each slab holds roughly ``block`` points, so nearest-neighbour queries
+            can stream over the grid with a cache-sized working set instead of
+            materialising the full N-by-3 coordinate array.
+
+        :param block: Approximate number of points per yielded slab.
+        """
+        x, y, z = self._axes_xyz
+        points_per_x = max(1, len(y) * len(z))
+        slab = max(1, block // points_per_x)
+        for start in range(0, len(x), slab):
+            yield np.stack(np.meshgrid(x[start:start + slab], y, z, indexing='ij', copy=False),
+                           axis=-1).reshape(-1, 3)
+
+    def filter_values(self, condition, replace_with=np.nan, out=None, inplace=False):
+        """
+        Make a numpy array containing values in the 3D volume,
             but with values replaced with a constant if the value satisfies a certain condition.
 
         :type condition: function | numpy.array
@@ -208,13 +322,31 @@ class Cube(object):
             If a numpy array, the value will be replaced if the argument's corresponding element
             at the same position within `self.values` is `False`.
         :param replace_with: Replace matching element with this constant. Defaults to `numpy.nan`.
+        :param out: Optional preallocated array to write the filtered values into,
+            so repeated filters can reuse one buffer instead of allocating a full copy each time.
+        :type inplace: bool
+        :param inplace: If `True`, replace values directly within `self.values` and return it,
+            avoiding any extra allocation.
         :return: A filtered numpy array with replaced values.
         """
         if callable(condition):
             mask_array = condition(self.values)
         else:
             mask_array = condition
-        return np.where(mask_array, self.values, replace_with)
+        # scalar or lower-rank masks (e.g. an empty selection) broadcast
+        # against the full volume, as np.where used to do
+        mask_array = np.broadcast_to(np.asarray(mask_array), self.values.shape)
+
+        if inplace and self.values.flags.writeable:
+            out = self.values
+        elif out is None:
+            # cached cubes hold a read-only memory map, so an in-place request
+            # on one falls back to a fresh buffer like the arithmetic operators do
+            out = np.empty_like(self.values)
+        if out is not self.values:
+            np.copyto(out, self.values)
+        np.putmask(out, np.logical_not(mask_array), replace_with)
+        return out
 
     def points_labelled_by_closest_atom(self, *atom_descriptors, **kwargs):
         """
@@ -226,15 +358,28 @@ class Cube(object):
         # if no arg, then all atoms are used
         if atom_descriptors:
             atoms = self.molecule.select_descriptor(*atom_descriptors)
+            atom_positions = np.array([atom.position for atom in atoms])
         else:
             atoms = self.molecule.atoms
-
-        atom_positions = np.array([atom.position for atom in atoms])
-        closest_by_args = cdist(self.flat_coordinates, atom_positions, **kwargs
-                                ).argmin(axis=1).reshape(self.n_voxels)
-
-        # Turn indices of argument in atom_label_numbers into actual label
-        return np.vectorize(atoms.__getitem__)(closest_by_args)
+            atom_positions = self.molecule.list_of_atom_property('position')
+
+        # a KD-tree query is O(N log A) and never materialises the N_voxels x N_atoms
+        # distance matrix that cdist + argmin would allocate;
+        # streaming the query by x-slab keeps the working set cache-resident
+        tree = cKDTree(atom_positions)
+        closest_by_args = np.empty(int(np.prod(self.n_voxels)), dtype=np.intp)
+        offset = 0
+        for block_points in self._iter_flat_blocks():
+            closest_by_args[offset:offset + len(block_points)] = \
+                tree.query(block_points, k=1, workers=-1, **kwargs)[1]
+            offset += len(block_points)
+        closest_by_args = closest_by_args.reshape(self.n_voxels)
+
+        # Turn indices of argument in atom_label_numbers into actual label,
+        # through one C-level fancy index instead of a Python callback per point
+        atom_references = np.empty(len(atoms), dtype=object)
+        atom_references[:] = atoms
+        return atom_references[closest_by_args]
 
     def distance_to_closest_atom(self, *atom_descriptors):
         """
@@ -249,13 +394,32 @@ class Cube(object):
         """
         # if no arg, then all atoms are used
         if atom_descriptors:
-            atoms = self.molecule.select_descriptor(atom_descriptors)
+            atoms = self.molecule.select_descriptor(*atom_descriptors)
+            atom_positions = np.array([atom.position for atom in atoms])
         else:
-            atoms = self.molecule.atoms
-
-        atom_positions = [atom.position for atom in atoms]
-        return cdist(self.flat_coordinates, np.array(atom_positions)
-                     ).min(axis=1).reshape(self.n_voxels)
+            atom_positions = self.molecule.list_of_atom_property('position')
+
+        # For very large grids the computation is bandwidth-bound on the CPU,
+        # so offload to the GPU when one is available
+        if _kernels.HAS_CUDA and np.prod(self.n_voxels) > _kernels.GPU_MIN_VOXELS:
+            x, y, z = self._axes_xyz
+            return _kernels.min_distance_grid_gpu(x, y, z, atom_positions)
+
+        # With numba installed, a fused kernel over the 1D axes avoids
+        # materialising flat_coordinates altogether
+        if _kernels.HAS_NUMBA:
+            x, y, z = self._axes_xyz
+            out = np.empty(tuple(self.n_voxels))
+            _kernels.min_distance_grid(x, y, z, atom_positions, out)
+            return out
+
+        tree = cKDTree(atom_positions)
+        distances = np.empty(int(np.prod(self.n_voxels)))
+        offset = 0
+        for block_points in self._iter_flat_blocks():
+            distances[offset:offset + len(block_points)] = tree.query(block_points, k=1, workers=-1)[0]
+            offset += len(block_points)
+        return distances.reshape(self.n_voxels)
 
     def value_by_atom(self, selected_descriptors, filter_descriptors):
         # Get an array of closest atoms
@@ -279,61 +443,84 @@ class Cube(object):
     """
     Several native Python magic methods for performing cube_1 + cube_2, cube_1 * cube_2 operations, etc.
     """
-    def __add__(self, other):
-        args = self._grid_args
-        if isinstance(other, int) or isinstance(other, float) or isinstance(other, np.ndarray):
-            return Cube(self.from_file, self.values + other, *args)
-        elif isinstance(other, Cube):
+    def _binop(self, other, operation):
+        """Shared type dispatch for the arithmetic magic methods below."""
+        if isinstance(other, Cube):
             if self.values.shape != other.values.shape:
-                raise AttributeError("Cube files must have the same coordinates to be summed.")
-            return Cube(self.from_file, self.values + other.values, *args)
-        else:
-            raise AttributeError
+                raise AttributeError("Cube files must have the same coordinates for arithmetic operations.")
+            other = other.values
+        elif not isinstance(other, _NUMERIC_TYPES):
+            # let Python try the reflected operation on the other operand
+            return NotImplemented
+        # writing into a preallocated buffer keeps one allocation per operation
+        # and pins the result to the cube's own dtype
+        out = np.empty_like(self.values, subok=False)
+        operation(self.values, other, out=out)
+        return self.assign_new_values_to(self, out)
+
+    def _ibinop(self, other, operation):
+        """In-place counterpart of :meth:`_binop`, mutating ``self.values`` directly."""
+        if not self.values.flags.writeable:
+            # cached cubes hold a read-only memory map of the sidecar file,
+            # so fall back to the allocating form and rebind the result
+            return self._binop(other, operation)
+        if isinstance(other, Cube):
+            if self.values.shape != other.values.shape:
+                raise AttributeError("Cube files must have the same coordinates for arithmetic operations.")
+            other = other.values
+        elif not isinstance(other, _NUMERIC_TYPES):
+            return NotImplemented
+        operation(self.values, other, out=self.values)
+        return self
+
+    def __add__(self, other):
+        return self._binop(other, np.add)
 
     def __sub__(self, other):
-        if isinstance(other, int) or isinstance(other, float) or isinstance(other, np.ndarray):
-            return self.assign_new_values_to(self, self.values - other)
-        elif isinstance(other, Cube):
-            if self.values.shape != other.values.shape:
-                raise AttributeError("Cube files must have the same coordinates to be summed.")
-            return self.assign_new_values_to(self, self.values - other.values)
-        else:
-            raise AttributeError
+        return self._binop(other, np.subtract)
+
+    def __iadd__(self, other):
+        # accumulating many cubes in a loop allocates nothing per step this way
+        return self._ibinop(other, np.add)
+
+    def __isub__(self, other):
+        return self._ibinop(other, np.subtract)
 
     def __mul__(self, other):
-        args = self._grid_args
-        if isinstance(other, int) or isinstance(other, float) or isinstance(other, np.ndarray):
-            return Cube(self.from_file, self.values * other, *args)
-        elif isinstance(other, Cube):
-            if self.values.shape != other.values.shape:
-                raise AttributeError("Cube files must have the same coordinates to be summed.")
-            return Cube(self.from_file, self.values * other.values, *args)
-        else:
-            raise AttributeError
+        return self._binop(other, np.multiply)
 
     def __truediv__(self, other):
-        args = self._grid_args
-        if isinstance(other, int) or isinstance(other, float) or isinstance(other, np.ndarray):
-            return Cube(self.from_file, self.values * other, *args)
-        elif isinstance(other, Cube):
-            if self.values.shape != other.values.shape:
-                raise AttributeError("Cube files must have the same coordinates to be summed.")
-            return Cube(self.from_file, self.values * other.values, *args)
-        else:
-            raise AttributeError
+        return self._binop(other, np.true_divide)
 
     def __pow__(self, power, modulo=None):
-        args = self._grid_args
-        if isinstance(power, int) or isinstance(power, float) or isinstance(power, np.ndarray):
-            return Cube(self.from_file, self.values ** power, *args)
-        elif isinstance(power, Cube):
-            if self.values.shape != power.values.shape:
-                raise AttributeError("Cube files must have the same coordinates to be summed.")
-            return Cube(self.from_file, self.values ** power.values, *args)
-        else:
-            raise AttributeError
+        return self._binop(power, np.power)
 
     def __abs__(self):
         return self.assign_new_values_to(self, np.abs(self.values))
 
+    def eval(self, expression, **named):
+        """
+        Evaluate an arithmetic expression over this cube in a single fused pass.
+
+        Chained operator arithmetic such as ``(a - b) ** 2 / c`` writes one full-size
+            temporary array per operation; numexpr compiles the whole expression and
+            evaluates it in one multi-threaded pass, so prefer this method in hot loops.
+            Requires the optional ``numexpr`` package.
+
+        For example, ``a.eval('(self - b) ** 2 / c', b=b, c=c)``.
+
+        :type expression: str
+        :param expression: Expression understood by :func:`numexpr.evaluate`,
+            where ``self`` refers to this cube's values.
+        :param named: Other names referenced in the expression,
+            given as ``Cube`` instances, numpy arrays or scalars.
+        :return: A new ``Cube`` object holding the evaluated values.
+        """
+        import numexpr
+
+        local_dict = {name: value.values if isinstance(value, Cube) else value
+                      for name, value in named.items()}
+        local_dict['self'] = self.values
+        return self.assign_new_values_to(self, numexpr.evaluate(expression, local_dict=local_dict))
+
 
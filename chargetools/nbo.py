@@ -1,5 +1,11 @@
+import mmap
 import re
 
+# Hot-path patterns, compiled once at import rather than per parsed line
+_ORBITAL_RE = re.compile(r'\d+\.\s+(BD|RY|CR|LP)(\*?)\s*\((\s*\d+)\)\s*\w+\s*(\d+)')
+_SEGMENT_ATOM_RE = re.compile(r'\w+\s*(\d+)')
+_COLUMN_GAP_RE = re.compile(r' {2,}')
+
 
 class NBO:
     """A class to help parsing E(2) perturbation energies from NBO analysis outputted by Gaussian."""
@@ -13,31 +19,50 @@ class NBO:
     @classmethod
     def read(cls, fname):
         d = dict(perturbation=[])
-        e2_parsing = False
-
-        f = open(fname, 'r')
-        for line in f:
-            # SECOND ORDER PERTURBATION THEORY ANALYSIS OF FOCK MATRIX IN NBO BASIS.
-            if e2_parsing:
-                if not re.search(r'\S+', line):
-                    next_line = next(f)
-                    if not re.search(r'\S+', next_line):
-                        e2_parsing = False
-                else:
-                     segments = [s for s in line.split(sep='  ') if s]
-
-                     if len(segments) == 5:
-                        donor_str, acceptor_str, e2, energy_diff, fock_param = segments
-                        donor = NaturalOrbital.from_nbo_log(donor_str)
-                        acceptor = NaturalOrbital.from_nbo_log(acceptor_str)
-                        e2, energy_diff, fock_param = map(float, segments[-3:])
-                        d['perturbation'].append(NBOPerturbation(donor, acceptor, e2, energy_diff, fock_param))
-
-            else:
-                if line.split() == '  Donor NBO (i)   Acceptor NBO (j)  kcal/mol   a.u.    a.u.'.split():
-                    e2_parsing = True
-
-        f.close()
+
+        # Memory-map the log and jump straight to the E2 table header,
+        # instead of allocating a Python string for every line of the file
+        with open(fname, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # SECOND ORDER PERTURBATION THEORY ANALYSIS OF FOCK MATRIX IN NBO BASIS.
+        # Open-shell logs carry one E2 table per spin, so re-arm the header
+        # search after each table rather than stopping at the first
+        size = buffer.size()
+        position = buffer.find(b'Donor NBO (i)')
+        while position != -1:
+            position = buffer.find(b'\n', position) + 1
+            if position == 0:
+                break
+            while position < size:
+                end = buffer.find(b'\n', position)
+                if end == -1:
+                    end = size
+                line = buffer[position:end]
+                position = end + 1
+
+                if not line.strip():
+                    # a blank line is followed by a unit header, which is skipped;
+                    # two consecutive blank lines end the table
+                    next_end = buffer.find(b'\n', position)
+                    if next_end == -1:
+                        next_end = size
+                    if not buffer[position:next_end].strip():
+                        break
+                    position = next_end + 1
+                    continue
+
+                segments = [s for s in _COLUMN_GAP_RE.split(line.decode('ascii')) if s.strip()]
+                if len(segments) == 5:
+                    donor_str, acceptor_str = segments[:2]
+                    donor = NaturalOrbital.from_nbo_log(donor_str)
+                    acceptor = NaturalOrbital.from_nbo_log(acceptor_str)
+                    e2, energy_diff, fock_param = map(float, segments[-3:])
+                    d['perturbation'].append(NBOPerturbation(donor, acceptor, e2, energy_diff, fock_param))
+
+            position = buffer.find(b'Donor NBO (i)', position)
+
+        buffer.close()
         return cls(fname, **d)
 
 
@@ -61,12 +86,10 @@ class NaturalOrbital:
     @classmethod
     def from_nbo_log(cls, string):
         main, *segments = string.split('-')
-        orbital_type, asterisk_str, orbital_number, atom_label_1 = re.search(
-            r'\d+\.\s+(BD|RY|CR|LP)(\*?)\s*\((\s*\d+)\)\s*\w+\s*(\d+)', main).groups()
+        orbital_type, asterisk_str, orbital_number, atom_label_1 = _ORBITAL_RE.search(main).groups()
 
         related_atoms = [atom_label_1]
         for segment in segments:
-            atom_label = re.search(r'\w+\s*(\d+)', segment).group(1)
-            related_atoms.append(atom_label)
+            related_atoms.append(_SEGMENT_ATOM_RE.search(segment).group(1))
 
         return cls(asterisk_str == '*', orbital_type, related_atoms)
@@ -1,10 +1,24 @@
 import numpy as np
 import pyqtgraph.opengl as gl
 
+from chargetools import _kernels
+
 
 def clip_and_normalize(arr, minimum, maximum):
+    # evaluate the log only where the clipped value is positive, rather than
+    # taking it over the whole array and discarding half through np.where
     clipped = np.clip(arr, minimum, maximum)
-    return np.where(clipped > 0, np.log(clipped**2), -np.inf)
+    positive = clipped > 0
+    np.multiply(clipped, clipped, out=clipped)
+    out = np.full_like(clipped, -np.inf)
+    np.log(clipped, out=out, where=positive)
+    return out
+
+
+def _channel_peak(extreme, midpoint, upper):
+    """Peak value of a colour channel; clip and log are monotonic, so it follows from the extreme alone."""
+    clipped = np.clip(extreme, midpoint, upper)
+    return np.log(clipped ** 2) if clipped > 0 else -np.inf
 
 
 def color_scale(arr, max_num=None):
@@ -34,17 +48,29 @@ def get_volume(cube, global_max=None, grid=False, midpoint=0):
         print("{0} – using {1} as 100% opacity, which is this file's maximum."
               .format(cube.from_file, pos_upper))
 
-    # R
-    positive = clip_and_normalize(val, midpoint, pos_upper)
-    d2[..., 0] = color_scale(positive)
-    # G
-    negative = clip_and_normalize(-val, midpoint, neg_upper)
-    d2[..., 1] = color_scale(negative)
-    # B
-    d2[..., 2] = d2[..., 1]
-    # Alpha (opacity)
-    d2[..., 3] = d2[..., 0] * 0.3 + d2[..., 1] * 0.3
-    d2[..., 3] = (d2[..., 3].astype(float) / 255.)**2 * 255
+    if _kernels.HAS_NUMBA:
+        # One fused parallel pass writes all four byte channels directly,
+        # instead of a clip / log / where / scale chain that materialises
+        # several cube-sized temporaries along the way
+        # keep the cube's native (by default single) precision end to end;
+        # at float32 the pass moves half the bytes of a float64 one
+        values = np.ascontiguousarray(val).ravel()
+        _kernels.fill_rgba(values, d2.reshape(-1, 4), float(midpoint),
+                           float(pos_upper), float(neg_upper),
+                           255. / _channel_peak(val.max(), midpoint, pos_upper),
+                           255. / _channel_peak(-val.min(), midpoint, neg_upper))
+    else:
+        # R
+        positive = clip_and_normalize(val, midpoint, pos_upper)
+        d2[..., 0] = color_scale(positive)
+        # G
+        negative = clip_and_normalize(-val, midpoint, neg_upper)
+        d2[..., 1] = color_scale(negative)
+        # B
+        d2[..., 2] = d2[..., 1]
+        # Alpha (opacity)
+        d2[..., 3] = d2[..., 0] * 0.3 + d2[..., 1] * 0.3
+        d2[..., 3] = (d2[..., 3].astype(float) / 255.)**2 * 255
 
     # show axes at origin
     ax = gl.GLAxisItem()
@@ -1,3 +1,4 @@
+import numpy as np
 import pyqtgraph.opengl as gl
 from pyqtgraph.Qt import QtCore
 
@@ -45,10 +46,14 @@ class SyncedWidget(gl.GLViewWidget):
 
 
 def camera_sync(dist_active, elev_active, azi_active, active_widget):
-    widgets = active_widget.sync_with
-    for w in widgets:
-        dist, elev, azi, cent = w.opts['distance'], w.opts['elevation'], w.opts['azimuth'], w.opts['center']
-        if dist_active != dist or elev_active != elev or azi_active != azi:
+    # pack the active camera state once per event,
+    # so each synced widget costs one array compare instead of
+    # per-key dict reads and chained comparisons
+    active_opts = np.array([dist_active, elev_active, azi_active], dtype=float)
+    for w in active_widget.sync_with:
+        opts = w.opts
+        other = np.array([opts['distance'], opts['elevation'], opts['azimuth']], dtype=float)
+        if not np.array_equal(active_opts, other):
             w.setCameraPosition(distance=dist_active, elevation=elev_active,
                                 azimuth=azi_active)
 
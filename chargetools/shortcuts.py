@@ -1,8 +1,10 @@
 """
 Convenience functions to parse files in mass.
 """
+import functools
 import glob
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 from chargetools.exceptions import InputError
 
@@ -36,12 +38,21 @@ def parse_directory_for_charge(directory_path, extensions=None, base_molecule=No
     from chargetools import entities
     if base_molecule is None:
         ac_query = os.path.join(directory_path, '*.ac')
-        files = glob.glob(ac_query)[0]
-        if len(files) > 0:
+        files = glob.glob(ac_query)
+        if not files:
+            raise InputError('No .ac file found within directory. Please specify base molecule.')
+        if len(files) > 1:
             raise InputError('Multiple .ac files found within directory. '
                              'Please specify base molecule, or delete duplicate .ac files from directory.')
-        base_molecule = entities.Molecule.from_ac_file(ac_query, **kwargs)
-
+        base_molecule = entities.Molecule.from_ac_file(files[0], **kwargs)
+
+    if len(valid_files) > 1:
+        # parsing is independent per file and holds the GIL while tokenizing,
+        # so fan the files out over worker processes
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(
+                functools.partial(entities.MoleculeWithCharge.from_file, base_molecule=base_molecule),
+                valid_files))
     return [entities.MoleculeWithCharge.from_file(valid_file, base_molecule) for valid_file in valid_files]
 
 
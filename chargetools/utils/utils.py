@@ -1,9 +1,13 @@
 import re
-from io import BytesIO
+from io import StringIO
+from itertools import islice
+from math import fabs
 
 import numpy as np
 import periodictable
 
+from chargetools import _kernels
+
 
 def int_if_close(floating_number, tolerance=0.0001):
     """
@@ -19,56 +23,174 @@ def int_if_close(floating_number, tolerance=0.0001):
     :return: Integer or float, depending on whether the input is close enough to its closest integer.
     """
     floating_number = float(floating_number)
-    if abs(round(floating_number, 0) - floating_number) <= tolerance:
-        return round(floating_number, 0)
+    # round once by hand; round(x, 0) would dispatch through __round__ twice
+    # and hand back a float even for whole numbers
+    nearest = int(floating_number + 0.5) if floating_number >= 0 else -int(0.5 - floating_number)
+    if fabs(nearest - floating_number) <= tolerance:
+        return nearest
     return floating_number
 
 
+def int_if_close_array(array, tolerance=0.0001):
+    """
+    Vectorised counterpart of :func:`int_if_close` for whole parsed columns.
+
+    :type array: numpy.array
+    :param array: Array of floating numbers, some of which may be better represented as integers.
+    :type tolerance: float
+    :param tolerance: If a number is within this range of its closest integer, it is rounded.
+    :rtype: numpy.array
+    :return: Float array with near-integer entries replaced by their rounded values.
+    """
+    array = np.asarray(array, dtype=float)
+    # np.rint is the underlying ufunc; np.round adds a dispatching wrapper
+    rounded = np.rint(array)
+    return np.where(np.abs(rounded - array) <= tolerance, rounded, array)
+
+
 def chained_or(*args):
-    if args:
-        res = args[0]
-        for arg in args[1:]:
-            res = np.logical_or(res, arg)
-        return res
-    return False
+    if not args:
+        return False
+    if len(args) == 1:
+        return args[0]
+    if (_kernels.HAS_NUMBA
+            and all(isinstance(arg, np.ndarray) and arg.dtype == bool
+                    and arg.shape == args[0].shape and arg.flags.c_contiguous for arg in args)
+            and args[0].size > _kernels.OR_KERNEL_MIN_SIZE):
+        # one fused pass over all masks at once,
+        # instead of a full memory traversal per pair
+        out = np.empty(args[0].size, dtype=bool)
+        _kernels.or_reduce(out, tuple(arg.reshape(-1) for arg in args))
+        return out.reshape(args[0].shape)
+    if all(isinstance(arg, np.ndarray) and arg.dtype == bool
+           and arg.shape == args[0].shape and arg.flags.c_contiguous for arg in args):
+        # bools are one byte each, so viewing eight at a time as uint64
+        # lets each bitwise-OR instruction combine eight mask elements
+        out = np.array(args[0], copy=True)
+        flat = out.reshape(-1)
+        head = flat.size - flat.size % 8
+        if head:
+            wide = flat[:head].view(np.uint64)
+            for arg in args[1:]:
+                np.bitwise_or(wide, arg.reshape(-1)[:head].view(np.uint64), out=wide)
+        if head < flat.size:
+            for arg in args[1:]:
+                np.logical_or(flat[head:], arg.reshape(-1)[head:], out=flat[head:])
+        return out
+    # reduce in place into one output buffer, seeded at the full broadcast
+    # shape so scalar and lower-rank leading masks still promote the way
+    # chained np.logical_or calls did
+    shape = np.broadcast_shapes(*(np.shape(arg) for arg in args))
+    out = np.array(np.broadcast_to(args[0], shape))
+    for arg in args[1:]:
+        if arg is True:
+            # a scalar True saturates the union outright
+            out[...] = True
+            return out
+        np.logical_or(out, arg, out=out)
+        # once the union saturates, the remaining ORs would only re-touch
+        # every element; the .all() scan is only worth it on large masks
+        if out.dtype == bool and out.size > 2 ** 16 and out.all():
+            return out
+    return out
+
+
+# Lookup tables built once at import time,
+# so each conversion is a hash probe rather than a scan of the periodic table
+_NUMBER_TO_SYMBOL = {element.number: element.symbol for element in periodictable.elements}
+_SYMBOL_TO_NUMBER = {symbol: number for number, symbol in _NUMBER_TO_SYMBOL.items()}
+# dense variant of the same table, so whole arrays of atomic numbers
+# resolve through one fancy-index gather
+_SYMBOL_LUT = np.array([_NUMBER_TO_SYMBOL.get(number, '')
+                        for number in range(max(_NUMBER_TO_SYMBOL) + 1)], dtype='<U3')
 
 
 def atomic_number_to_symbol(number):
-    for element in periodictable.elements:
-        if element.number == number:
-            return element.symbol
-    return None
+    if np.ndim(number) > 0:
+        return _SYMBOL_LUT[np.asarray(number, dtype=int)]
+    return _NUMBER_TO_SYMBOL.get(number)
 
 
 def symbol_to_atomic_number(symbol):
-    for element in periodictable.elements:
-        if element.symbol == symbol:
-            return element.number
-    return None
+    return _SYMBOL_TO_NUMBER.get(symbol)
+
+
+# any character that would make a pattern more than a plain literal
+_REGEX_META_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
 
 
 def skip_til_occurence(iterator, line_re, count_until):
+    if count_until <= 0:
+        return
+    # plain literals skip the regex engine entirely: a C-level substring
+    # scan per line instead of pattern-machine dispatch
+    if isinstance(line_re, str) and not _REGEX_META_RE.search(line_re):
+        count = 0
+        while count < count_until:
+            if line_re in next(iterator):
+                count += 1
+        return
+    # compile once up front (precompiled patterns pass straight through),
+    # instead of paying the re-cache lookup on every line
+    pattern = line_re if hasattr(line_re, 'search') else re.compile(line_re)
+    # filter and islice run the scan loop in C; next() consumes lines up to
+    # and including the count_until-th match
+    next(islice(filter(pattern.search, iterator), count_until - 1, None))
+
+
+def iter_lines(iterator, skip=3, include_regex=r'\S'):
+    """
+    Yield lines from ``iterator`` past the skip count, stopping at the first
+        line the inclusion pattern rejects. Feeding the generator straight to
+        consumers such as :func:`numpy.genfromtxt` avoids buffering the whole
+        section as one string first.
+
+    :param iterator: Iterator of lines, e.g. an open file object.
+    :param skip: Number of matching lines to drop before yielding.
+    :param include_regex: Pattern a line must match to be included.
+    :return: Generator of lines.
+    """
     count = 0
-    while count < count_until:
+
+    # running out of input ends the section just like a failing match;
+    # letting StopIteration escape a generator is a RuntimeError since PEP 479
+    try:
         line = next(iterator)
-        if re.search(line_re, line):
-            count += 1
+        if include_regex == r'\S':
+            # the default predicate just asks "is the line non-blank",
+            # which str.strip answers without any regex dispatch
+            while line.strip():
+                if count >= skip:
+                    yield line
+                count += 1
+                line = next(iterator)
+        else:
+            pattern = include_regex if hasattr(include_regex, 'search') else re.compile(include_regex)
+            while pattern.search(line):
+                if count >= skip:
+                    yield line
+                count += 1
+                line = next(iterator)
+    except StopIteration:
+        return
 
 
 def consume_lines(iterator, skip=3, include_regex=r'\S'):
-    res = ""
-    count = 0
+    return ''.join(iter_lines(iterator, skip, include_regex))
 
-    line = next(iterator)
-    while re.search(include_regex, line):
-        if count >= skip:
-            res += line
 
-        count += 1
-        line = next(iterator)
-    return res
+# keyword arguments np.loadtxt understands with the same meaning as np.genfromtxt;
+# anything outside this set (skip_footer, missing_values, names, ...) needs
+# genfromtxt's more general row handling
+_LOADTXT_KWARGS = frozenset(('dtype', 'comments', 'delimiter', 'skiprows',
+                             'usecols', 'unpack', 'ndmin', 'encoding', 'max_rows'))
 
 
 def genfromstring(string, *args, **kwargs):
-    s = BytesIO(string.encode())
-    return np.genfromtxt(s, *args, **kwargs)
\ No newline at end of file
+    # feed the string in directly; encoding to bytes first just duplicates
+    # the buffer for genfromtxt to decode straight back
+    if not args and kwargs.get('dtype', float) is not None and _LOADTXT_KWARGS.issuperset(kwargs):
+        # plain dense tables go through loadtxt's much faster C parser;
+        # genfromtxt only pays off for missing-value and dtype-guessing work
+        return np.loadtxt(StringIO(string), **kwargs)
+    return np.genfromtxt(StringIO(string), *args, **kwargs)
\ No newline at end of file
@@ -7,5 +7,8 @@ setup(
     name="ChargeTools",
     version="0.1",
     packages=['chargetools'],
-    install_requires=['numpy', 'periodictable', 'scipy']
+    install_requires=['numpy>=1.20', 'periodictable>=1.6', 'scipy>=1.7'],
+    # numba powers the optional fused kernels in chargetools._kernels;
+    # everything falls back to NumPy/SciPy without it
+    extras_require={'fast': ['numba>=0.56']},
 )